@@ -5,7 +5,6 @@ Chronomaly - A forecasting and anomaly detection library.
 import sys
 from typing import Any, Optional
 from pathlib import Path
-from dotenv import load_dotenv
 
 __version__ = "1.0.0"
 
@@ -61,6 +60,9 @@ def configure(
         bool: True if the .env file was found and loaded (if env_file_path was used),
               False otherwise.
     """
+    # Imported lazily so that importing chronomaly does not pay for python-dotenv
+    from dotenv import load_dotenv
+
     env_loaded = False
 
     # Configure verbose mode
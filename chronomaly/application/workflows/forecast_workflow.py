@@ -4,11 +4,55 @@ Main forecast workflow orchestrator.
 
 import pandas as pd
 import inspect
+from functools import lru_cache
+from typing import Callable
 from ...infrastructure.data.readers.base import DataReader
 from ...infrastructure.forecasters.base import Forecaster
 from ...infrastructure.data.writers.base import DataWriter
 
 
+@lru_cache(maxsize=256)
+def _accepts_return_point(func: Callable) -> bool:
+    """
+    Check whether a forecast function accepts a return_point parameter.
+
+    The result is cached per function, so repeated runs do not re-parse the
+    signature. Only class-level functions should be passed here; use
+    _forecast_accepts_return_point for arbitrary forecast callables.
+
+    Args:
+        func: Forecast function or method
+
+    Returns:
+        bool: True if the function has a return_point parameter
+    """
+    try:
+        return "return_point" in inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def _forecast_accepts_return_point(forecast: Callable) -> bool:
+    """
+    Check whether a forecaster's forecast callable accepts return_point.
+
+    Bound methods are checked through their class-level function, so
+    instances of the same forecaster class share one cache entry. Any other
+    callable (plain functions, callable objects, possibly unhashable) is
+    inspected without caching, so the cache never holds per-instance
+    functions or closures.
+
+    Args:
+        forecast: The forecaster's forecast attribute
+
+    Returns:
+        bool: True if the callable has a return_point parameter
+    """
+    if inspect.ismethod(forecast):
+        return _accepts_return_point(forecast.__func__)
+    return _accepts_return_point.__wrapped__(forecast)
+
+
 class ForecastWorkflow:
     """
     Main orchestrator class for the forecast workflow.
@@ -90,8 +134,7 @@ class ForecastWorkflow:
             )
 
         # Step 2: Generate forecast
-        sig = inspect.signature(self.forecaster.forecast)
-        supports_return_point = "return_point" in sig.parameters
+        supports_return_point = _forecast_accepts_return_point(self.forecaster.forecast)
 
         if supports_return_point:
             forecast_df = self.forecaster.forecast(
@@ -141,9 +184,8 @@ class ForecastWorkflow:
             )
 
         # Step 2: Generate forecast
-        # Check if forecaster supports return_point parameter using inspect
-        sig = inspect.signature(self.forecaster.forecast)
-        supports_return_point = "return_point" in sig.parameters
+        # Check if forecaster supports return_point (cached per forecaster class)
+        supports_return_point = _forecast_accepts_return_point(self.forecaster.forecast)
 
         if supports_return_point:
             forecast_df = self.forecaster.forecast(
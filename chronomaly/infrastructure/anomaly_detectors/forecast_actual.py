@@ -3,6 +3,7 @@ Forecast vs Actual anomaly detection implementation.
 """
 
 import warnings
+import numpy as np
 import pandas as pd
 from typing import Optional, List, Dict, Callable
 from .base import AnomalyDetector
@@ -33,6 +34,12 @@ class ForecastActualAnomalyDetector(AnomalyDetector, TransformableMixin):
     QUANTILE_POINT_IDX = 0
     EXPECTED_QUANTILE_COUNT = 10
 
+    # Alert types indexed by the int8 codes returned from _classify
+    _NO_FORECAST, _IN_RANGE, _BELOW_LOWER, _ABOVE_UPPER = range(4)
+    _ALERT_TYPES = np.array(
+        ["NO_FORECAST", "IN_RANGE", "BELOW_LOWER", "ABOVE_UPPER"], dtype=object
+    )
+
     def __init__(
         self,
         dimension_names: List[str],
@@ -67,7 +74,7 @@ class ForecastActualAnomalyDetector(AnomalyDetector, TransformableMixin):
         Define the schema for result DataFrame columns.
 
         This is the single source of truth for column names and dtypes.
-        Used by both _get_empty_result_dataframe and _compare_metric.
+        Used by both _get_empty_result_dataframe and _compare_all_metrics.
 
         Returns:
             dict: Column names mapped to their pandas dtypes
@@ -96,16 +103,14 @@ class ForecastActualAnomalyDetector(AnomalyDetector, TransformableMixin):
         forecast_std, actual_std, all_columns = self._prepare_data(
             forecast_df, actual_df
         )
-        results = self._compare_all_metrics(forecast_std, actual_std, all_columns)
+        result_df = self._compare_all_metrics(forecast_std, actual_std, all_columns)
 
-        if not results:
+        if result_df.empty:
             empty_df = self._get_empty_result_dataframe()
             # Apply transformers to empty DataFrame for consistency
             empty_df = self._apply_transformers(empty_df, "after")
             return empty_df
 
-        result_df = pd.DataFrame(results)
-
         result_df = self._split_group_key_to_dimensions(result_df)
 
         # Apply transformers after detection
@@ -219,110 +224,199 @@ class ForecastActualAnomalyDetector(AnomalyDetector, TransformableMixin):
         forecast_std: pd.DataFrame,
         actual_std: pd.DataFrame,
         all_columns: list[str],
-    ) -> list[dict]:
-        results = []
-        for idx in forecast_std.index:
-            date_value = (
-                forecast_std.loc[idx, self.date_column]
-                if self.date_column in forecast_std.columns
-                else None
-            )
-            forecast_row = forecast_std.loc[idx]
-            actual_row = actual_std.loc[idx] if idx in actual_std.index else None
+    ) -> pd.DataFrame:
+        """
+        Compare every forecast cell with its actual value in one vectorized pass.
 
-            if actual_row is None:
-                continue
+        Rows without a matching actual row are skipped. Cells are laid out
+        row by row, so the result keeps the (date, metric) ordering of the
+        forecast frame.
 
-            for column in all_columns:
-                result = self._compare_metric(
-                    column, forecast_row[column], actual_row[column], date_value
-                )
-                results.append(result)
+        Args:
+            forecast_std: Standardized forecast data
+            actual_std: Standardized actual data
+            all_columns: Metric columns to compare
 
-        return results
+        Returns:
+            pd.DataFrame: One row per compared cell, empty if nothing matched
+        """
+        forecast_rows = forecast_std.loc[forecast_std.index.isin(actual_std.index)]
+        if forecast_rows.empty or not all_columns:
+            return pd.DataFrame()
 
-    def _compare_metric(
-        self,
-        column: str,
-        forecast_value: str,
-        actual_value: float,
-        date_value: Optional[pd.Timestamp] = None,
-    ) -> dict:
-        forecast_parts = str(forecast_value).split("|")
+        actual_rows = actual_std.loc[forecast_rows.index, all_columns]
+        n_rows, n_columns = len(forecast_rows), len(all_columns)
 
-        try:
-            point_forecast = (
-                float(forecast_parts[self.QUANTILE_POINT_IDX])
-                if len(forecast_parts) > self.QUANTILE_POINT_IDX
-                else 0.0
-            )
-            lower_bound = (
-                float(forecast_parts[self.lower_quantile_idx])
-                if len(forecast_parts) > self.lower_quantile_idx
-                else 0.0
-            )
-            upper_bound = (
-                float(forecast_parts[self.upper_quantile_idx])
-                if len(forecast_parts) > self.upper_quantile_idx
-                else 0.0
-            )
+        quantiles, part_counts = self._parse_quantiles(
+            pd.Series(forecast_rows[all_columns].to_numpy().ravel())
+        )
+        point_forecast, lower_bound, upper_bound = self._select_quantiles(
+            quantiles, part_counts
+        )
 
-            if len(forecast_parts) < self.EXPECTED_QUANTILE_COUNT:
-                warnings.warn(
-                    f"Expected {self.EXPECTED_QUANTILE_COUNT} quantiles, "
-                    f"got {len(forecast_parts)}."
-                )
-        except (ValueError, IndexError):
-            point_forecast = lower_bound = upper_bound = 0.0
+        actual = pd.to_numeric(
+            pd.Series(actual_rows.to_numpy().ravel()), errors="coerce"
+        ).to_numpy(dtype=np.float64)
+        actual = np.where(np.isfinite(actual), actual, 0.0)
 
-        try:
-            actual = float(actual_value)
-        except (ValueError, TypeError):
-            actual = 0.0
-
-        status = "NO_FORECAST"
-        deviation_pct = 0.0
-
-        if pd.isna(lower_bound) or pd.isna(upper_bound) or pd.isna(point_forecast):
-            status = "NO_FORECAST"
-        elif lower_bound == 0 and upper_bound == 0 and point_forecast == 0:
-            status = "NO_FORECAST"
-        elif lower_bound <= actual <= upper_bound:
-            status = "IN_RANGE"
-        else:
-            if actual < lower_bound:
-                status = "BELOW_LOWER"
-                deviation_pct = (
-                    ((lower_bound - actual) / lower_bound)
-                    if lower_bound != 0
-                    else (abs(actual) if actual != 0 else 0.0)
-                )
-            elif actual > upper_bound:
-                status = "ABOVE_UPPER"
-                deviation_pct = (
-                    ((actual - upper_bound) / upper_bound)
-                    if upper_bound != 0
-                    else (abs(actual) if actual != 0 else 0.0)
-                )
+        alert_codes, deviation_pct = self._classify(
+            point_forecast, lower_bound, upper_bound, actual
+        )
 
         result = {
-            "group_key": column,
+            "group_key": np.tile(np.asarray(all_columns, dtype=object), n_rows),
             "metric_name": self.metric_name,
-            "actual_value": round(actual),
-            "forecast_value": round(point_forecast),
-            "lower_limit": round(lower_bound),
-            "upper_limit": round(upper_bound),
-            "alert_type": status,
-            "anomaly_score": round(deviation_pct, 2),
+            "actual_value": np.rint(actual).astype(np.int64),
+            "forecast_value": np.rint(point_forecast).astype(np.int64),
+            "lower_limit": np.rint(lower_bound).astype(np.int64),
+            "upper_limit": np.rint(upper_bound).astype(np.int64),
+            "alert_type": self._ALERT_TYPES[alert_codes],
+            # Python's round() rounds the exact binary value; np.round scales by
+            # 100 first and can round ties such as 1.075 up instead of down
+            "anomaly_score": np.array(
+                [round(score, 2) for score in deviation_pct.tolist()]
+            ),
         }
 
-        if date_value is not None:
+        if self.date_column in forecast_rows.columns:
             # Convert to date only (remove time component for consistency)
-            if isinstance(date_value, pd.Timestamp):
-                date_value = date_value.date()
-            result = {self.date_column: date_value, **result}
+            dates = [
+                value.date() if isinstance(value, pd.Timestamp) else value
+                for value in forecast_rows[self.date_column]
+            ]
+            result = {
+                self.date_column: np.repeat(np.asarray(dates, dtype=object), n_columns),
+                **result,
+            }
+
+        return pd.DataFrame(result)
+
+    @classmethod
+    def _classify(
+        cls,
+        point_forecast: np.ndarray,
+        lower_bound: np.ndarray,
+        upper_bound: np.ndarray,
+        actual: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Classify actual values against forecast bounds.
+
+        Cells whose point forecast and bounds are all 0 have no forecast.
+        Deviation is relative to the violated bound, or the absolute actual
+        value when that bound is 0.
+
+        Args:
+            point_forecast: Point forecast per cell
+            lower_bound: Lower confidence bound per cell
+            upper_bound: Upper confidence bound per cell
+            actual: Actual value per cell
+
+        Returns:
+            tuple: int8 alert codes (indexes into _ALERT_TYPES) and deviations
+        """
+        has_forecast = (point_forecast != 0) | (lower_bound != 0) | (upper_bound != 0)
+        in_range = has_forecast & (lower_bound <= actual) & (actual <= upper_bound)
+        below = has_forecast & ~in_range & (actual < lower_bound)
+        above = has_forecast & ~in_range & ~below & (actual > upper_bound)
+
+        alert_codes = np.full(actual.shape, cls._NO_FORECAST, dtype=np.int8)
+        alert_codes[in_range] = cls._IN_RANGE
+        alert_codes[below] = cls._BELOW_LOWER
+        alert_codes[above] = cls._ABOVE_UPPER
+
+        deviation_pct = np.zeros(actual.shape)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            deviation_pct[below] = np.where(
+                lower_bound[below] != 0,
+                (lower_bound[below] - actual[below]) / lower_bound[below],
+                np.abs(actual[below]),
+            )
+            deviation_pct[above] = np.where(
+                upper_bound[above] != 0,
+                (actual[above] - upper_bound[above]) / upper_bound[above],
+                np.abs(actual[above]),
+            )
+
+        return alert_codes, deviation_pct
+
+    def _parse_quantiles(
+        self, forecast_values: pd.Series
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Parse pipe-separated quantile strings into a float matrix.
+
+        All strings are split in a single call. Only the point forecast,
+        lower and upper quantile columns are converted, giving one
+        (n_values, 3) float64 array. Missing trailing quantiles and tokens
+        that are not numbers become NaN.
 
-        return result
+        Args:
+            forecast_values: Forecast cells, e.g. "1000|900|...|1100"
+
+        Returns:
+            tuple: Quantile matrix and number of parts found in each string
+        """
+        parts = forecast_values.astype(str).str.split("|", expand=True)
+        # Shorter strings are padded with None by the split
+        part_counts = parts.notna().sum(axis=1).to_numpy()
+
+        selected_parts = parts.reindex(
+            columns=[
+                self.QUANTILE_POINT_IDX,
+                self.lower_quantile_idx,
+                self.upper_quantile_idx,
+            ]
+        )
+        try:
+            quantiles = selected_parts.to_numpy(dtype=np.float64)
+        except ValueError:
+            quantiles = selected_parts.apply(pd.to_numeric, errors="coerce").to_numpy(
+                dtype=np.float64
+            )
+
+        return quantiles, part_counts
+
+    def _select_quantiles(
+        self, quantiles: np.ndarray, part_counts: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Pick the point forecast and confidence bounds from parsed quantiles.
+
+        Quantiles missing from a short string count as 0. If any of the
+        selected quantiles cannot be parsed as a finite number (including
+        "nan", "inf" and "-inf"), all three values of that cell are set to 0
+        so it is reported as NO_FORECAST.
+
+        Args:
+            quantiles: Quantile matrix from _parse_quantiles
+            part_counts: Number of parts found in each forecast string
+
+        Returns:
+            tuple: Point forecast, lower bound and upper bound arrays
+        """
+        selected = []
+        invalid = np.zeros(len(part_counts), dtype=bool)
+        for position, quantile_idx in enumerate(
+            (self.QUANTILE_POINT_IDX, self.lower_quantile_idx, self.upper_quantile_idx)
+        ):
+            present = part_counts > quantile_idx
+            values = np.where(present, quantiles[:, position], 0.0)
+            invalid |= ~np.isfinite(values)
+            selected.append(values)
+
+        short_counts = np.unique(
+            part_counts[~invalid & (part_counts < self.EXPECTED_QUANTILE_COUNT)]
+        )
+        for count in short_counts:
+            warnings.warn(
+                f"Expected {self.EXPECTED_QUANTILE_COUNT} quantiles, got {count}."
+            )
+
+        point_forecast, lower_bound, upper_bound = (
+            np.where(invalid, 0.0, values) for values in selected
+        )
+        return point_forecast, lower_bound, upper_bound
 
     def _get_empty_result_dataframe(self) -> pd.DataFrame:
         """
@@ -1,8 +1,21 @@
 """
 Database data readers.
+
+BigQueryDataReader is imported lazily on first access so that importing this
+package does not pull in google-cloud-bigquery.
 """
 
-from .bigquery import BigQueryDataReader
+from typing import Any
+
 from .sqlite import SQLiteDataReader
 
 __all__ = ["BigQueryDataReader", "SQLiteDataReader"]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "BigQueryDataReader":
+        from .bigquery import BigQueryDataReader
+
+        globals()[name] = BigQueryDataReader
+        return BigQueryDataReader
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
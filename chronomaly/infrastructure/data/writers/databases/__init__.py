@@ -1,8 +1,21 @@
 """
 Database data writers.
+
+BigQueryDataWriter is imported lazily on first access so that importing this
+package does not pull in google-cloud-bigquery.
 """
 
-from .bigquery import BigQueryDataWriter
+from typing import Any
+
 from .sqlite import SQLiteDataWriter
 
 __all__ = ["BigQueryDataWriter", "SQLiteDataWriter"]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "BigQueryDataWriter":
+        from .bigquery import BigQueryDataWriter
+
+        globals()[name] = BigQueryDataWriter
+        return BigQueryDataWriter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,8 +1,21 @@
 """
 Forecasting models.
+
+TimesFMForecaster is imported lazily on first access so that importing this
+package does not pull in torch and timesfm.
 """
 
+from typing import Any
+
 from .base import Forecaster
-from .timesfm import TimesFMForecaster
 
 __all__ = ["Forecaster", "TimesFMForecaster"]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "TimesFMForecaster":
+        from .timesfm import TimesFMForecaster
+
+        globals()[name] = TimesFMForecaster
+        return TimesFMForecaster
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,6 +3,7 @@ TimesFM forecaster implementation.
 """
 
 import os
+from functools import lru_cache
 
 import pandas as pd
 import numpy as np
@@ -20,12 +21,46 @@ except ImportError:
     )
 
 
+@lru_cache(maxsize=1)
+def _load_compiled_model(model_name: str, hf_token: Optional[str], config: Any) -> Any:
+    """
+    Load and compile a TimesFM model, memoized per process.
+
+    Forecasters created with the same model name, token and forecast config
+    share one compiled model instead of reloading the checkpoint each time.
+
+    Args:
+        model_name: TimesFM model name
+        hf_token: HuggingFace token for authenticated downloads
+        config: timesfm.ForecastConfig used to compile the model
+
+    Returns:
+        Compiled TimesFM model
+    """
+    torch.set_float32_matmul_precision("high")
+
+    model = timesfm.TimesFM_2p5_200M_torch.from_pretrained(
+        model_name,
+        token=hf_token,
+    )
+    model.compile(config)
+
+    return model
+
+
 class TimesFMForecaster(Forecaster, TransformableMixin):
     """
     Forecaster implementation using Google's TimesFM model.
 
     This forecaster supports both point forecasts and quantile forecasts.
-    Quantile values are returned as pipe-separated strings.
+    Quantile values are returned as pipe-separated strings. Every column of
+    the input DataFrame is forecast in one batched model call.
+
+    The most recently compiled model is cached for the lifetime of the
+    process and shared by all forecasters with the same model name, token
+    and configuration. Call TimesFMForecaster.clear_model_cache() to
+    release it; forecasters that already loaded the model keep their own
+    reference until they are discarded.
 
     Args:
         model_name: TimesFM model name (default: 'google/timesfm-2.5-200m-pytorch')
@@ -77,21 +112,30 @@ class TimesFMForecaster(Forecaster, TransformableMixin):
         )
         self._model: Any | None = None
 
+    @staticmethod
+    def clear_model_cache() -> None:
+        """
+        Release the process-wide compiled model cache.
+
+        The next forecaster that needs a model reloads and recompiles the
+        checkpoint.
+        """
+        _load_compiled_model.cache_clear()
+
     def _get_model(self) -> Any:
         """
         Initialize and compile TimesFM model.
 
+        The compiled model is shared with other forecasters that use the
+        same model name, token and configuration.
+
         Returns:
             Compiled TimesFM model
         """
         if self._model is None:
-            torch.set_float32_matmul_precision("high")
-
-            self._model = timesfm.TimesFM_2p5_200M_torch.from_pretrained(
-                self.model_name,
-                token=self.hf_token,
+            self._model = _load_compiled_model(
+                self.model_name, self.hf_token, self.config
             )
-            self._model.compile(self.config)
 
         return self._model
 
@@ -143,11 +187,13 @@ class TimesFMForecaster(Forecaster, TransformableMixin):
 
         model = self._get_model()
 
-        # Prepare inputs - each column is a separate time series
-        inputs = [dataframe[column].values for column in dataframe.columns]
-
         # Generate forecasts
         try:
+            # Prepare inputs - each column is a separate time series. The frame
+            # is converted once into an (n_series, context_len) array (missing
+            # values, including pd.NA, become NaN) and all series are sent to
+            # the model in a single batched call.
+            inputs = list(dataframe.to_numpy(dtype=np.float64, na_value=np.nan).T)
             forecast_point, forecast_quantile = model.forecast(
                 horizon=horizon, inputs=inputs
             )
@@ -264,7 +310,9 @@ class TimesFMForecaster(Forecaster, TransformableMixin):
         )
 
         # Create forecast dataframe
-        dataframe_forecast = pd.DataFrame(forecast_data, columns=dataframe.columns)
+        dataframe_forecast = pd.DataFrame(
+            forecast_data, columns=dataframe.columns, copy=False
+        )
         dataframe_forecast.columns.name = None
         dataframe_forecast.insert(0, "date", new_index)
         dataframe_forecast["date"] = dataframe_forecast["date"].dt.date
@@ -293,26 +341,17 @@ class TimesFMForecaster(Forecaster, TransformableMixin):
             forecast_quantile_quantiles,
         ) = forecast_quantile.shape
 
-        # Format quantiles as pipe-separated strings
-        forecast_data = []
-
-        for forecast_quantile_item in range(forecast_quantile_items):
-            forecast_data_row = []
-
-            for forecast_quantile_horizon in range(forecast_quantile_horizons):
-                cell_value = "|".join(
-                    map(
-                        str,
-                        forecast_quantile[
-                            forecast_quantile_item, forecast_quantile_horizon, :
-                        ],
-                    )
-                )
-                forecast_data_row.append(cell_value)
-
-            forecast_data.append(forecast_data_row)
-
-        forecast_data = np.array(forecast_data, dtype=object).T
+        # Format quantiles as pipe-separated strings. Values are converted to
+        # text in one vectorized astype(str) call and joined per cell, then
+        # laid out as a (horizon, series) object array.
+        quantile_strings = forecast_quantile.astype(str).reshape(
+            -1, forecast_quantile_quantiles
+        )
+        forecast_data = (
+            np.array(["|".join(cell) for cell in quantile_strings], dtype=object)
+            .reshape(forecast_quantile_items, forecast_quantile_horizons)
+            .T
+        )
 
         # Generate future dates
         last_date = self._get_last_date(dataframe)
@@ -334,7 +373,9 @@ class TimesFMForecaster(Forecaster, TransformableMixin):
         )
 
         # Create forecast dataframe
-        dataframe_forecast = pd.DataFrame(forecast_data, columns=dataframe.columns)
+        dataframe_forecast = pd.DataFrame(
+            forecast_data, columns=dataframe.columns, copy=False
+        )
         dataframe_forecast.columns.name = None
         dataframe_forecast.insert(0, "date", new_index)
         dataframe_forecast["date"] = dataframe_forecast["date"].dt.date
@@ -2,6 +2,7 @@
 Cumulative threshold filter - keeps top X% of rows by value.
 """
 
+import numpy as np
 import pandas as pd
 from typing import List, Optional
 from .base import DataFrameFilter
@@ -51,29 +52,26 @@ class CumulativeThresholdFilter(DataFrameFilter):
         if df.empty or self.value_column not in df.columns:
             return df.copy()
 
+        # Work on the underlying array; NaN values never pass the filter
+        values = df[self.value_column].to_numpy(dtype=np.float64, na_value=np.nan)
+
         # Calculate total
-        total_value = df[self.value_column].sum()
+        total_value = np.nansum(values)
 
         if total_value == 0:
             return df.copy()
 
-        # Sort and calculate cumulative percentage
-        sorted_values = df[self.value_column].sort_values(ascending=False)
-        cumulative_sum = sorted_values.cumsum()
-        cumulative_pct = cumulative_sum / total_value
+        # Sort descending (NaN last) and calculate cumulative percentage
+        sorted_values = -np.sort(-values)
+        cumulative_pct = np.cumsum(sorted_values) / total_value
 
-        # Find minimum threshold value
+        # Find minimum threshold value: the value at the first position where
+        # the cumulative percentage reaches the threshold
         threshold_mask = cumulative_pct >= self.threshold_pct
         if threshold_mask.any():
-            # Use position-based indexing (argmax + iloc) instead of
-            # label-based (idxmax + loc) to handle DataFrames with
-            # non-sequential indices correctly
-            first_exceed_pos = (
-                threshold_mask.argmax()
-            )  # Position of first True (0-based)
-            min_threshold = sorted_values.iloc[: first_exceed_pos + 1].min()
+            min_threshold = sorted_values[threshold_mask.argmax()]
         else:
-            min_threshold = sorted_values.min()
+            min_threshold = np.nanmin(values)
 
         # Filter original DataFrame
-        return df[df[self.value_column] >= min_threshold].copy()
+        return df[values >= min_threshold].copy()
@@ -2,11 +2,49 @@
 Column formatter - applies custom formatting functions to columns.
 """
 
+import numpy as np
 import pandas as pd
 from typing import List, Union, Callable, Dict
 from .base import DataFrameFormatter
 
 
+class _PercentageFormat:
+    """
+    Percentage formatting function created by ColumnFormatter.percentage().
+
+    Calling it formats a single value. Numeric columns are formatted in one
+    vectorized np.char.mod call via format_series() instead of per value.
+    """
+
+    def __init__(self, decimal_places: int, multiply_by_100: bool) -> None:
+        self.decimal_places: int = decimal_places
+        self.multiply_by_100: bool = multiply_by_100
+
+    def __call__(self, value: float) -> str:
+        if self.multiply_by_100:
+            value = value * 100
+        return f"{value:.{self.decimal_places}f}%"
+
+    def format_series(self, series: pd.Series) -> pd.Series:
+        """
+        Format a whole column at once.
+
+        Args:
+            series: Column to format
+
+        Returns:
+            pd.Series: Formatted column
+        """
+        if not pd.api.types.is_numeric_dtype(series):
+            return series.apply(self)
+
+        values = series.to_numpy(dtype=np.float64)
+        if self.multiply_by_100:
+            values = values * 100
+        formatted = np.char.mod(f"%.{self.decimal_places}f%%", values)
+        return pd.Series(formatted, index=series.index, dtype=object)
+
+
 class ColumnFormatter(DataFrameFormatter):
     """
     Apply custom formatting functions to DataFrame columns.
@@ -51,10 +89,7 @@ class ColumnFormatter(DataFrameFormatter):
         column_list = [columns] if isinstance(columns, str) else columns
 
         # Create formatting function
-        def format_percentage(value):
-            if multiply_by_100:
-                value = value * 100
-            return f"{value:.{decimal_places}f}%"
+        format_percentage = _PercentageFormat(decimal_places, multiply_by_100)
 
         # Create formatters dict
         formatters = {col: format_percentage for col in column_list}
@@ -78,6 +113,9 @@ class ColumnFormatter(DataFrameFormatter):
 
         for column, format_func in self.formatters.items():
             if column in result.columns:
-                result[column] = result[column].apply(format_func)
+                if isinstance(format_func, _PercentageFormat):
+                    result[column] = format_func.format_series(result[column])
+                else:
+                    result[column] = result[column].apply(format_func)
 
         return result
@@ -2,6 +2,7 @@
 Data transformation utilities for pivot operations.
 """
 
+import numpy as np
 import pandas as pd
 from typing import Union, List
 
@@ -96,17 +97,21 @@ class PivotTransformer:
             if df[column].dtype == "object" and column not in index_list:
                 # Check if column actually contains strings
                 try:
+                    # Clean each distinct value once and map the results back
+                    # through the factorized codes (-1 marks missing values)
+                    values = df[column].to_numpy()
+                    codes, uniques = pd.factorize(df[column])
+
                     # Only apply string operations if column contains strings
-                    if (
-                        df[column]
-                        .apply(lambda x: isinstance(x, str) if x is not None else True)
-                        .all()
+                    if all(isinstance(x, str) for x in uniques) and all(
+                        x is None for x in values[codes == -1]
                     ):
-                        df[column] = (
-                            df[column]
-                            .str.lower()
+                        cleaned = (
+                            uniques.str.lower()
                             .str.replace(r"[\(\)\.\-\_\s]", "", regex=True)
+                            .to_numpy(dtype=object)
                         )
+                        df[column] = np.append(cleaned, None)[codes]
                 except (AttributeError, TypeError) as e:
                     # Skip columns that don't support string operations
                     # Log the issue for debugging but don't fail
@@ -132,12 +137,14 @@ class PivotTransformer:
             pivot_columns = columns_list[0]
 
         try:
-            # Create pivot table
-            dataframe_pivot = df.pivot_table(
-                index=index_list,
-                columns=pivot_columns,
-                values=self.values,
-                aggfunc="sum",
+            # Create pivot table in two phases: aggregate to one row per
+            # (index, series) key, then reshape the series key into columns.
+            # observed=True keeps categorical index columns from expanding
+            # into every unobserved category combination.
+            dataframe_pivot = (
+                df.groupby(index_list + [pivot_columns], observed=True)[self.values]
+                .sum()
+                .unstack(pivot_columns)
             )
         except ValueError as e:
             # Common issues: duplicate indices, incompatible types, etc.
@@ -8,9 +8,19 @@ Run this after installing dependencies: pip install -r requirements.txt
 import pandas as pd
 from datetime import datetime
 
+_SAMPLE: tuple[pd.DataFrame, pd.DataFrame] | None = None
+
 
 def create_sample_data():
-    """Create sample forecast and actual data for testing."""
+    """
+    Create sample forecast and actual data for testing.
+
+    The frames are built once and shared by every test in this module, so
+    tests must not modify them in place.
+    """
+    global _SAMPLE
+    if _SAMPLE is not None:
+        return _SAMPLE
 
     # Sample date
     test_date = datetime(2024, 1, 15)
@@ -36,162 +46,103 @@ def create_sample_data():
             65,
             75,
             28,
-        ],  # organic in range, paid above, organic below, paid in range
+        ],  # organic in range, paid above, organic in range, paid in range
     }
     actual_df = pd.DataFrame(actual_data)
 
-    return forecast_df, actual_df
+    _SAMPLE = (forecast_df, actual_df)
+    return _SAMPLE
+
+
+_RESULTS: pd.DataFrame | None = None
+
+
+def detect_sample_anomalies():
+    """
+    Run unfiltered anomaly detection on the sample data.
+
+    Detection runs once per module; filtered views are derived from this
+    result with boolean masks instead of running the detector again.
+    """
+    global _RESULTS
+    if _RESULTS is not None:
+        return _RESULTS
+
+    from chronomaly.infrastructure.anomaly_detectors import ForecastActualComparator
+    from chronomaly.infrastructure.transformers import PivotTransformer
+
+    forecast_df, actual_df = create_sample_data()
+
+    # Pivot actual data (transformer moved to component level)
+    transformer = PivotTransformer(
+        index="date", columns=["platform", "channel"], values="sessions"
+    )
+    actual_df_pivoted = transformer(actual_df)
+
+    detector = ForecastActualComparator(
+        dimension_names=["platform", "channel"], metric_name="sessions"
+    )
+
+    # Run detection with pivoted actual data
+    _RESULTS = detector.detect(forecast_df, actual_df_pivoted)
+    return _RESULTS
 
 
 def test_anomaly_detection():
     """Test the anomaly detection workflow."""
+    results = detect_sample_anomalies()
+
+    assert len(results) == 4
+
+    # Expected results:
+    # desktop_organic: 95 (IN_RANGE, between 90-110)
+    # desktop_paid: 65 (ABOVE_UPPER, above 60)
+    # mobile_organic: 75 (IN_RANGE, between 70-90)
+    # mobile_paid: 28 (IN_RANGE, between 25-40)
+    alert_types = dict(zip(results["group_key"], results["alert_type"]))
+    assert alert_types == {
+        "desktop_organic": "IN_RANGE",
+        "desktop_paid": "ABOVE_UPPER",
+        "mobile_organic": "IN_RANGE",
+        "mobile_paid": "IN_RANGE",
+    }
+
+    mobile_organic = results[results["group_key"] == "mobile_organic"].iloc[0]
+    assert mobile_organic["actual_value"] == 75
+    assert mobile_organic["lower_limit"] == 70
+    assert mobile_organic["upper_limit"] == 90
 
-    try:
-        from chronomaly.infrastructure.anomaly_detectors import ForecastActualComparator
-        from chronomaly.infrastructure.transformers import PivotTransformer
-
-        # Create sample data
-        forecast_df, actual_df = create_sample_data()
-
-        print("=" * 60)
-        print("ANOMALY DETECTION TEST")
-        print("=" * 60)
-
-        print("\n1. FORECAST DATA (Pivot format with quantiles):")
-        print("-" * 60)
-        print(forecast_df.to_string(index=False))
-
-        print("\n2. ACTUAL DATA (Raw format):")
-        print("-" * 60)
-        print(actual_df.to_string(index=False))
-
-        # Pivot actual data (transformer moved to component level)
-        transformer = PivotTransformer(
-            index="date", columns=["platform", "channel"], values="sessions"
-        )
-        actual_df_pivoted = transformer(actual_df)
-
-        print("\n2b. ACTUAL DATA (After pivot):")
-        print("-" * 60)
-        print(actual_df_pivoted.to_string())
-
-        # Configure detector (no transformer parameter)
-        detector = ForecastActualComparator(
-            date_column="date", exclude_columns=["date"]
-        )
-
-        # Run detection with pivoted actual data
-        results = detector.detect(forecast_df, actual_df_pivoted)
-
-        print("\n3. ANOMALY DETECTION RESULTS:")
-        print("-" * 60)
-        print(results.to_string(index=False))
-
-        print("\n4. SUMMARY:")
-        print("-" * 60)
-        print(f"Total metrics analyzed: {len(results)}")
-        print("\nStatus breakdown:")
-        print(results["status"].value_counts())
-
-        # Show anomalies
-        anomalies = results[results["status"].isin(["BELOW_P10", "ABOVE_P90"])]
-        print(f"\nAnomalies detected: {len(anomalies)}")
-
-        if len(anomalies) > 0:
-            print("\nAnomaly details:")
-            print(
-                anomalies[
-                    ["metric", "actual", "q10", "q90", "status", "deviation_pct"]
-                ].to_string(index=False)
-            )
-
-        print("\n5. EXPECTED RESULTS:")
-        print("-" * 60)
-        print("• desktop_organic: 95 (IN_RANGE, between 90-110)")
-        print("• desktop_paid: 65 (ABOVE_P90, above 60)")
-        print("• mobile_organic: 75 (BELOW_P10, below 70)")
-        print("• mobile_paid: 28 (IN_RANGE, between 25-40)")
-
-        print("\n" + "=" * 60)
-        print("TEST COMPLETED SUCCESSFULLY!")
-        print("=" * 60)
-
-        return results
-
-    except ImportError as e:
-        print(f"Error: {e}")
-        print("\nPlease install dependencies first:")
-        print("  pip install -r requirements.txt")
-        return None
-    except Exception as e:
-        print(f"Error during test: {e}")
-        import traceback
-
-        traceback.print_exc()
-        return None
+    assert (results["metric_name"] == "sessions").all()
+    assert results["platform"].tolist() == ["desktop", "desktop", "mobile", "mobile"]
+    assert results["channel"].tolist() == ["organic", "paid", "organic", "paid"]
 
 
 def test_with_filter():
-    """Test the filtered detection method."""
-
-    try:
-        from chronomaly.infrastructure.anomaly_detectors import ForecastActualComparator
-        from chronomaly.infrastructure.transformers import PivotTransformer
-
-        # Create sample data
-        forecast_df, actual_df = create_sample_data()
-
-        # Pivot actual data (transformer moved to component level)
-        transformer = PivotTransformer(
-            index="date", columns=["platform", "channel"], values="sessions"
-        )
-        actual_df_pivoted = transformer(actual_df)
-
-        # Configure detector with filters (no transformer parameter)
-        from chronomaly.infrastructure.transformers.filters import ValueFilter
-
-        detector = ForecastActualComparator(
-            date_column="date",
-            transformers={
-                "after": [
-                    ValueFilter(
-                        "status", values=["BELOW_LOWER", "ABOVE_UPPER"], mode="include"
-                    ),
-                    ValueFilter("deviation_pct", min_value=0.05),  # 5% minimum
-                ]
-            },
-        )
-
-        print("\n" + "=" * 60)
-        print("FILTERED DETECTION TEST")
-        print("=" * 60)
-
-        # Run detection with pivoted actual data
-        filtered_results = detector.detect(
-            forecast_df=forecast_df, actual_df=actual_df_pivoted
-        )
-
-        print("\nFiltered results (deviation > 5%):")
-        print("-" * 60)
-        if len(filtered_results) > 0:
-            print(filtered_results.to_string(index=False))
-        else:
-            print("No significant anomalies found.")
-
-        return filtered_results
-
-    except Exception as e:
-        print(f"Error during filtered test: {e}")
-        import traceback
-
-        traceback.print_exc()
-        return None
+    """Test filtering the detection results."""
+    from chronomaly.infrastructure.transformers.filters import ValueFilter
+
+    # Reuse the unfiltered results and apply the filters on top of them
+    results = detect_sample_anomalies()
+
+    filtered_results = results
+    for value_filter in [
+        ValueFilter(
+            "alert_type", values=["BELOW_LOWER", "ABOVE_UPPER"], mode="include"
+        ),
+        ValueFilter("anomaly_score", min_value=0.05),  # 5% minimum
+    ]:
+        filtered_results = value_filter.filter(filtered_results)
+
+    # Only desktop_paid (65 against an upper limit of 60) is left
+    assert len(filtered_results) == 1
+    row = filtered_results.iloc[0]
+    assert row["group_key"] == "desktop_paid"
+    assert row["alert_type"] == "ABOVE_UPPER"
+    assert row["actual_value"] == 65
+    assert row["upper_limit"] == 60
+    assert row["anomaly_score"] == 0.08
 
 
 if __name__ == "__main__":
-    # Run basic test
-    results = test_anomaly_detection()
-
-    # Run filtered test
-    if results is not None:
-        test_with_filter()
+    test_anomaly_detection()
+    test_with_filter()
@@ -241,6 +241,73 @@ class TestInvalidQuantileFormat:
         assert len(result) == 1
         assert result.iloc[0]["alert_type"] == "NO_FORECAST"
 
+    def test_mixed_quantile_strings_in_one_frame(self):
+        """Test valid, incomplete and non-numeric quantile strings together."""
+        detector = ForecastActualComparator(
+            dimension_names=["platform"], metric_name="sessions"
+        )
+
+        forecast_df = pd.DataFrame(
+            {
+                "date": [datetime(2024, 1, 1)],
+                "desktop": ["100|90|92|94|96|100|102|104|106|110"],
+                "mobile": ["100|90|92"],
+                "tablet": ["100|abc|92|95|98|100|102|105|108|110"],
+            }
+        )
+        actual_df = pd.DataFrame(
+            {
+                "date": [datetime(2024, 1, 1)],
+                "desktop": [120.0],
+                "mobile": [95.0],
+                "tablet": [95.0],
+            }
+        )
+
+        with pytest.warns(UserWarning, match="Expected 10 quantiles, got 3"):
+            result = detector.detect(forecast_df, actual_df)
+
+        assert result["group_key"].tolist() == ["desktop", "mobile", "tablet"]
+        assert result["alert_type"].tolist() == [
+            "ABOVE_UPPER",
+            "ABOVE_UPPER",
+            "NO_FORECAST",
+        ]
+        assert result["lower_limit"].tolist() == [90, 90, 0]
+        assert result["upper_limit"].tolist() == [110, 0, 0]
+        assert result.iloc[0]["anomaly_score"] == pytest.approx(0.09)
+
+    def test_non_finite_quantiles_are_no_forecast(self):
+        """Test that nan and infinite quantiles are reported as NO_FORECAST."""
+        detector = ForecastActualComparator(
+            dimension_names=["platform"], metric_name="sessions"
+        )
+
+        forecast_df = pd.DataFrame(
+            {
+                "date": [datetime(2024, 1, 1)],
+                "desktop": ["100|80|82|84|86|100|114|116|118|inf"],
+                "mobile": ["100|-inf|82|84|86|100|114|116|118|120"],
+                "tablet": ["nan|80|82|84|86|100|114|116|118|120"],
+            }
+        )
+        actual_df = pd.DataFrame(
+            {
+                "date": [datetime(2024, 1, 1)],
+                "desktop": [130.0],
+                "mobile": [130.0],
+                "tablet": [130.0],
+            }
+        )
+
+        result = detector.detect(forecast_df, actual_df)
+
+        assert result["alert_type"].tolist() == ["NO_FORECAST"] * 3
+        assert result["forecast_value"].tolist() == [0, 0, 0]
+        assert result["lower_limit"].tolist() == [0, 0, 0]
+        assert result["upper_limit"].tolist() == [0, 0, 0]
+        assert result["actual_value"].tolist() == [130, 130, 130]
+
 
 class TestDivisionByZeroEdgeCases:
     """Test cases for division by zero scenarios."""
@@ -319,6 +386,37 @@ class TestDivisionByZeroEdgeCases:
         assert result.iloc[0]["alert_type"] == "NO_FORECAST"
 
 
+class TestAnomalyScoreRounding:
+    """Test cases for rounding of anomaly scores."""
+
+    def test_anomaly_score_rounds_like_python_round(self):
+        """Test that scores on .xx5 ties round like Python's round()."""
+        detector = ForecastActualComparator(
+            dimension_names=["platform"], metric_name="sessions"
+        )
+
+        forecast_df = pd.DataFrame(
+            {
+                "date": [datetime(2024, 1, 1)],
+                "desktop": ["100|100|100|100|100|100|100|100|100|100"],
+                "mobile": ["100|100|100|100|100|100|100|100|100|100"],
+            }
+        )
+        actual_df = pd.DataFrame(
+            {
+                "date": [datetime(2024, 1, 1)],
+                "desktop": [207.5],  # (207.5 - 100) / 100 == 1.075
+                "mobile": [50.5],  # (100 - 50.5) / 100 == 0.495
+            }
+        )
+
+        result = detector.detect(forecast_df, actual_df)
+
+        assert result["alert_type"].tolist() == ["ABOVE_UPPER", "BELOW_LOWER"]
+        # np.round would give 1.08 and 0.5 here
+        assert result["anomaly_score"].tolist() == [1.07, 0.49]
+
+
 class TestAllZeroValues:
     """Test cases for scenarios where all values are zero."""
 
@@ -5,9 +5,43 @@ These tests verify that all newly discovered bugs have been properly fixed.
 
 import pytest
 import pandas as pd
-from unittest.mock import Mock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 from chronomaly.application.workflows import ForecastWorkflow
+from chronomaly.application.workflows.forecast_workflow import _accepts_return_point
+from chronomaly.infrastructure.data.readers import DataReader
+from chronomaly.infrastructure.data.writers import DataWriter
 from chronomaly.infrastructure.data.writers.databases import BigQueryDataWriter
+from chronomaly.infrastructure.forecasters import Forecaster
+
+# Shared read-only frames; neither the mocked writer nor the workflow
+# modifies them, so tests can reuse the same objects.
+_TINY_DF = pd.DataFrame({"a": [1, 2, 3]})
+_DATE_IDX3 = pd.date_range("2024-01-01", periods=3)
+_LOAD_DF = pd.DataFrame({"a": [1, 2, 3]}, index=_DATE_IDX3)
+
+
+@pytest.fixture
+def workflow_mocks():
+    """Spec'd reader, forecaster and writer mocks plus a workflow using them."""
+    mock_reader = MagicMock(spec=DataReader)
+    mock_forecaster = MagicMock(spec=Forecaster)
+    mock_writer = MagicMock(spec=DataWriter)
+    workflow = ForecastWorkflow(
+        data_reader=mock_reader, forecaster=mock_forecaster, data_writer=mock_writer
+    )
+    return mock_reader, mock_forecaster, mock_writer, workflow
+
+
+@pytest.fixture
+def mock_bq_client():
+    """Patch the BigQuery client class and yield the client it returns."""
+    with patch(
+        "chronomaly.infrastructure.data.writers.databases.bigquery.bigquery.Client"
+    ) as mock_client_class:
+        mock_client = MagicMock()
+        mock_client_class.return_value = mock_client
+        mock_client.load_table_from_dataframe.return_value = MagicMock()
+        yield mock_client
 
 
 class TestBug008BigQueryDispositionValidation:
@@ -53,147 +87,143 @@ class TestBug008BigQueryDispositionValidation:
 class TestBug009BigQueryErrorHandling:
     """Tests for BUG-009: BigQuery writer has no error handling for job failures"""
 
-    @patch("chronomaly.infrastructure.data.writers.databases.bigquery.bigquery.Client")
-    def test_job_failure_raises_runtime_error_with_context(self, mock_client_class):
+    def test_job_failure_raises_runtime_error_with_context(self, mock_bq_client):
         """
         BUG-009: Test that job failures raise RuntimeError with helpful context.
         """
-        # Setup mock
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
-
         # Make job.result() raise an exception
-        mock_job = MagicMock()
+        mock_job = mock_bq_client.load_table_from_dataframe.return_value
         mock_job.result.side_effect = Exception("Permission denied")
-        mock_client.load_table_from_dataframe.return_value = mock_job
 
         writer = BigQueryDataWriter(dataset="test_dataset", table="test_table")
 
-        # Create test dataframe
-        df = pd.DataFrame({"a": [1, 2, 3]})
-
         # Should raise RuntimeError with context
         with pytest.raises(RuntimeError, match="Failed to write to BigQuery table"):
-            writer.write(df)
+            writer.write(_TINY_DF)
 
         # Verify the error message includes table information
         with pytest.raises(RuntimeError, match="test_dataset.test_table"):
-            writer.write(df)
+            writer.write(_TINY_DF)
 
 
 class TestBug010WorkflowTypeErrorHandling:
     """Tests for BUG-010: Workflow overly broad exception handling"""
 
-    def test_forecaster_without_return_point_parameter(self):
+    def test_forecaster_without_return_point_parameter(self, workflow_mocks):
         """
         BUG-010: Test that forecasters without return_point parameter work correctly.
         Uses inspect instead of try/except TypeError.
         """
-        # Create mock components
-        mock_reader = Mock()
-        mock_reader.load.return_value = pd.DataFrame(
-            {"a": [1, 2, 3]}, index=pd.date_range("2024-01-01", periods=3)
-        )
+        mock_reader, mock_forecaster, _, workflow = workflow_mocks
+        mock_reader.load.return_value = _LOAD_DF
 
         # Forecaster WITHOUT return_point parameter
-        mock_forecaster = Mock()
-        mock_forecaster.forecast = Mock(
-            return_value=pd.DataFrame(
-                {"a": [4, 5]}, index=pd.date_range("2024-01-04", periods=2)
-            )
-        )
-
         # Remove return_point from signature by using a function
         def forecast_no_return_point(dataframe, horizon):
             return pd.DataFrame({"a": [4, 5]})
 
         mock_forecaster.forecast = forecast_no_return_point
 
-        mock_writer = Mock()
-
-        # Create workflow
-        workflow = ForecastWorkflow(
-            data_reader=mock_reader, forecaster=mock_forecaster, data_writer=mock_writer
-        )
-
         # Should work without error (inspect detects missing parameter)
         result = workflow.run(horizon=2, return_point=True)
         assert result is not None
 
-    def test_forecaster_with_return_point_parameter(self):
+    def test_forecaster_with_return_point_parameter(self, workflow_mocks):
         """
         BUG-010: Test that forecasters WITH return_point parameter work correctly.
         """
-        # Create mock components
-        mock_reader = Mock()
-        mock_reader.load.return_value = pd.DataFrame(
-            {"a": [1, 2, 3]}, index=pd.date_range("2024-01-01", periods=3)
-        )
+        mock_reader, mock_forecaster, _, workflow = workflow_mocks
+        mock_reader.load.return_value = _LOAD_DF
 
         # Forecaster WITH return_point parameter
-        mock_forecaster = Mock()
-
         def forecast_with_return_point(dataframe, horizon, return_point=False):
             return pd.DataFrame({"a": [4, 5]})
 
         mock_forecaster.forecast = forecast_with_return_point
 
-        mock_writer = Mock()
-
-        # Create workflow
-        workflow = ForecastWorkflow(
-            data_reader=mock_reader, forecaster=mock_forecaster, data_writer=mock_writer
-        )
-
         # Should pass return_point parameter
         result = workflow.run(horizon=2, return_point=True)
         assert result is not None
 
+    def test_return_point_check_is_cached_per_forecaster_class(self):
+        """
+        BUG-010: Test that the signature check is shared by instances of a class.
+        """
+
+        class PointForecaster(Forecaster):
+            def forecast(self, dataframe, horizon, return_point=False):
+                return pd.DataFrame({"a": [float(return_point)] * horizon})
+
+        _accepts_return_point.cache_clear()
+
+        for _ in range(2):
+            mock_reader = MagicMock(spec=DataReader)
+            mock_reader.load.return_value = _LOAD_DF
+            workflow = ForecastWorkflow(
+                data_reader=mock_reader,
+                forecaster=PointForecaster(),
+                data_writer=MagicMock(spec=DataWriter),
+            )
+
+            result = workflow.run(horizon=2, return_point=True)
+
+            assert result["a"].tolist() == [1.0, 1.0]
+
+        cache_info = _accepts_return_point.cache_info()
+        assert cache_info.misses == 1
+        assert cache_info.hits == 1
+
+    def test_unhashable_forecast_callable_is_checked_without_cache(
+        self, workflow_mocks
+    ):
+        """
+        BUG-010: Test that an unhashable forecast callable still runs and
+        is not stored in the signature cache.
+        """
+        mock_reader, mock_forecaster, _, workflow = workflow_mocks
+        mock_reader.load.return_value = _LOAD_DF
+
+        class UnhashableForecast:
+            __hash__ = None
+
+            def __call__(self, dataframe, horizon, return_point=False):
+                return pd.DataFrame({"a": [float(return_point)] * horizon})
+
+        mock_forecaster.forecast = UnhashableForecast()
+        _accepts_return_point.cache_clear()
+
+        result = workflow.run(horizon=2, return_point=True)
+
+        assert result["a"].tolist() == [1.0, 1.0]
+        assert _accepts_return_point.cache_info().currsize == 0
+
 
 class TestBug011WorkflowHorizonValidation:
     """Tests for BUG-011: Workflow doesn't validate horizon parameter"""
 
-    def test_negative_horizon_raises_error(self):
+    def test_negative_horizon_raises_error(self, workflow_mocks):
         """
         BUG-011: Test that negative horizon raises ValueError.
         """
-        mock_reader = Mock()
-        mock_forecaster = Mock()
-        mock_writer = Mock()
-
-        workflow = ForecastWorkflow(
-            data_reader=mock_reader, forecaster=mock_forecaster, data_writer=mock_writer
-        )
+        workflow = workflow_mocks[3]
 
         with pytest.raises(ValueError, match="horizon must be a positive integer"):
             workflow.run(horizon=-5)
 
-    def test_zero_horizon_raises_error(self):
+    def test_zero_horizon_raises_error(self, workflow_mocks):
         """
         BUG-011: Test that zero horizon raises ValueError.
         """
-        mock_reader = Mock()
-        mock_forecaster = Mock()
-        mock_writer = Mock()
-
-        workflow = ForecastWorkflow(
-            data_reader=mock_reader, forecaster=mock_forecaster, data_writer=mock_writer
-        )
+        workflow = workflow_mocks[3]
 
         with pytest.raises(ValueError, match="horizon must be a positive integer"):
             workflow.run(horizon=0)
 
-    def test_non_integer_horizon_raises_error(self):
+    def test_non_integer_horizon_raises_error(self, workflow_mocks):
         """
         BUG-011: Test that non-integer horizon raises ValueError.
         """
-        mock_reader = Mock()
-        mock_forecaster = Mock()
-        mock_writer = Mock()
-
-        workflow = ForecastWorkflow(
-            data_reader=mock_reader, forecaster=mock_forecaster, data_writer=mock_writer
-        )
+        workflow = workflow_mocks[3]
 
         with pytest.raises(ValueError, match="horizon must be a positive integer"):
             workflow.run(horizon=5.5)
@@ -205,56 +235,35 @@ class TestBug011WorkflowHorizonValidation:
 class TestBug012WorkflowDataValidation:
     """Tests for BUG-012: Workflow doesn't validate loaded data"""
 
-    def test_empty_dataframe_raises_error(self):
+    def test_empty_dataframe_raises_error(self, workflow_mocks):
         """
         BUG-012: Test that empty DataFrame raises ValueError.
         """
-        mock_reader = Mock()
+        mock_reader, _, _, workflow = workflow_mocks
         mock_reader.load.return_value = pd.DataFrame()  # Empty DataFrame
 
-        mock_forecaster = Mock()
-        mock_writer = Mock()
-
-        workflow = ForecastWorkflow(
-            data_reader=mock_reader, forecaster=mock_forecaster, data_writer=mock_writer
-        )
-
         with pytest.raises(ValueError, match="Data reader returned empty dataset"):
             workflow.run(horizon=10)
 
-    def test_none_dataframe_raises_error(self):
+    def test_none_dataframe_raises_error(self, workflow_mocks):
         """
         BUG-012: Test that None DataFrame raises ValueError.
         """
-        mock_reader = Mock()
+        mock_reader, _, _, workflow = workflow_mocks
         mock_reader.load.return_value = None  # None instead of DataFrame
 
-        mock_forecaster = Mock()
-        mock_writer = Mock()
-
-        workflow = ForecastWorkflow(
-            data_reader=mock_reader, forecaster=mock_forecaster, data_writer=mock_writer
-        )
-
         with pytest.raises(ValueError, match="Data reader returned empty dataset"):
             workflow.run(horizon=10)
 
-    def test_empty_after_transform_raises_error(self):
+    def test_empty_after_transform_raises_error(self, workflow_mocks):
         """
         BUG-012: Test that empty DataFrame from reader raises ValueError.
         Note: Transformers are now configured at component level, not workflow level.
         """
         # Reader returns empty DataFrame (simulating empty result after transformation)
-        mock_reader = Mock()
+        mock_reader, _, _, workflow = workflow_mocks
         mock_reader.load.return_value = pd.DataFrame()  # Empty after transform
 
-        mock_forecaster = Mock()
-        mock_writer = Mock()
-
-        workflow = ForecastWorkflow(
-            data_reader=mock_reader, forecaster=mock_forecaster, data_writer=mock_writer
-        )
-
         with pytest.raises(ValueError, match="Data reader returned empty dataset"):
             workflow.run(horizon=10)
 
@@ -262,54 +271,36 @@ class TestBug012WorkflowDataValidation:
 class TestBug007BigQueryDeprecatedAPI:
     """Tests for BUG-007: BigQuery writer uses deprecated API"""
 
-    @patch("chronomaly.infrastructure.data.writers.databases.bigquery.bigquery.Client")
-    def test_uses_table_id_string_not_deprecated_methods(self, mock_client_class):
+    def test_uses_table_id_string_not_deprecated_methods(self, mock_bq_client):
         """
         BUG-007: Test that modern table_id string is used instead of
         deprecated dataset().table().
         """
-        # Setup mock
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
-
-        mock_job = MagicMock()
-        mock_client.load_table_from_dataframe.return_value = mock_job
-
         writer = BigQueryDataWriter(
             project="test_project", dataset="test_dataset", table="test_table"
         )
 
-        df = pd.DataFrame({"a": [1, 2, 3]})
-        writer.write(df)
+        writer.write(_TINY_DF)
 
         # Verify load_table_from_dataframe was called with string table_id
         # not with deprecated table reference object
-        call_args = mock_client.load_table_from_dataframe.call_args
+        call_args = mock_bq_client.load_table_from_dataframe.call_args
         table_ref_arg = call_args[0][1]  # Second positional argument
 
         # Should be a string, not a TableReference object
         assert isinstance(table_ref_arg, str)
         assert table_ref_arg == "test_project.test_dataset.test_table"
 
-    @patch("chronomaly.infrastructure.data.writers.databases.bigquery.bigquery.Client")
-    def test_table_id_without_project(self, mock_client_class):
+    def test_table_id_without_project(self, mock_bq_client):
         """
         BUG-007: Test table_id construction when project is not specified.
         """
-        # Setup mock
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
-
-        mock_job = MagicMock()
-        mock_client.load_table_from_dataframe.return_value = mock_job
-
         writer = BigQueryDataWriter(dataset="test_dataset", table="test_table")
 
-        df = pd.DataFrame({"a": [1, 2, 3]})
-        writer.write(df)
+        writer.write(_TINY_DF)
 
         # Verify table_id format without project
-        call_args = mock_client.load_table_from_dataframe.call_args
+        call_args = mock_bq_client.load_table_from_dataframe.call_args
         table_ref_arg = call_args[0][1]
 
         assert isinstance(table_ref_arg, str)
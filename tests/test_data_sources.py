@@ -4,7 +4,6 @@ Tests for bugs #1, #5, #6, #7.
 """
 
 import pytest
-import pandas as pd
 import sqlite3
 from chronomaly.infrastructure.data.readers.files import CSVDataReader
 from chronomaly.infrastructure.data.readers.databases import SQLiteDataReader
@@ -12,6 +11,32 @@ from chronomaly.infrastructure.data.readers.databases import SQLiteDataReader
 # Old: CSVDataReader, SQLiteDataReader
 
 
+@pytest.fixture(scope="module")
+def sqlite_db(tmp_path_factory):
+    """
+    SQLite database shared by the SQLite reader tests.
+
+    Contains a 'date_table' with a date column and a 'timestamp_table' whose
+    date column is named 'timestamp'. Tests only read from it.
+    """
+    db_file = tmp_path_factory.mktemp("sqlite") / "test.db"
+    # Throwaway test data needs no durability: skip the on-disk journal and fsync
+    conn = sqlite3.connect(str(db_file), isolation_level=None)
+    conn.execute("PRAGMA journal_mode=MEMORY")
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.executescript(
+        """
+        CREATE TABLE date_table(date TEXT, value INTEGER);
+        INSERT INTO date_table VALUES
+            ('2024-01-01', 1), ('2024-01-02', 2), ('2024-01-03', 3);
+        CREATE TABLE timestamp_table(timestamp TEXT, value INTEGER);
+        INSERT INTO timestamp_table SELECT date, value FROM date_table;
+        """
+    )
+    conn.close()
+    return str(db_file)
+
+
 class TestCSVDataReader:
     """Tests for CSVDataReader"""
 
@@ -19,17 +44,14 @@ class TestCSVDataReader:
         """Test CSV loading with valid date column"""
         # Create test CSV
         csv_file = tmp_path / "test.csv"
-        df = pd.DataFrame(
-            {"date": ["2024-01-01", "2024-01-02", "2024-01-03"], "value": [1, 2, 3]}
-        )
-        df.to_csv(csv_file, index=False)
+        csv_file.write_text("date,value\n2024-01-01,1\n2024-01-02,2\n2024-01-03,3\n")
 
         # Load with date_column
         source = CSVDataReader(file_path=str(csv_file), date_column="date")
         result = source.load()
 
         # Verify date column is parsed as datetime
-        assert pd.api.types.is_datetime64_any_dtype(result["date"])
+        assert result["date"].dtype.kind == "M"
 
     def test_csv_with_missing_date_column_should_raise_error(self, tmp_path):
         """
@@ -38,13 +60,9 @@ class TestCSVDataReader:
         """
         # Create test CSV with 'timestamp' column, not 'date'
         csv_file = tmp_path / "test.csv"
-        df = pd.DataFrame(
-            {
-                "timestamp": ["2024-01-01", "2024-01-02", "2024-01-03"],
-                "value": [1, 2, 3],
-            }
+        csv_file.write_text(
+            "timestamp,value\n2024-01-01,1\n2024-01-02,2\n2024-01-03,3\n"
         )
-        df.to_csv(csv_file, index=False)
 
         # Try to load with date_column='date' (which doesn't exist)
         source = CSVDataReader(file_path=str(csv_file), date_column="date")
@@ -57,41 +75,27 @@ class TestCSVDataReader:
 class TestSQLiteDataReader:
     """Tests for SQLiteDataReader"""
 
-    def test_sqlite_with_valid_query(self, tmp_path):
+    def test_sqlite_with_valid_query(self, sqlite_db):
         """Test SQLite loading with valid query"""
-        # Create test database
-        db_file = tmp_path / "test.db"
-        conn = sqlite3.connect(str(db_file))
-        df = pd.DataFrame(
-            {"date": ["2024-01-01", "2024-01-02", "2024-01-03"], "value": [1, 2, 3]}
-        )
-        df.to_sql("test_table", conn, index=False)
-        conn.close()
-
         # Load with valid query
         source = SQLiteDataReader(
-            database_path=str(db_file),
-            query="SELECT * FROM test_table",
+            database_path=sqlite_db,
+            query="SELECT * FROM date_table",
             date_column="date",
         )
         result = source.load()
 
         assert len(result) == 3
-        assert pd.api.types.is_datetime64_any_dtype(result["date"])
+        assert result["date"].dtype.kind == "M"
 
-    def test_sqlite_with_invalid_query_should_show_proper_error(self, tmp_path):
+    def test_sqlite_with_invalid_query_should_show_proper_error(self, sqlite_db):
         """
         Bug #1: Test that SQLite error is properly propagated.
         Currently this test will FAIL because UnboundLocalError is raised.
         """
-        # Create test database
-        db_file = tmp_path / "test.db"
-        conn = sqlite3.connect(str(db_file))
-        conn.close()
-
         # Try to load with invalid query
         source = SQLiteDataReader(
-            database_path=str(db_file), query="SELECT * FROM nonexistent_table"
+            database_path=sqlite_db, query="SELECT * FROM nonexistent_table"
         )
 
         # Should raise sqlite3.OperationalError, not UnboundLocalError (BUG #1)
@@ -101,27 +105,16 @@ class TestSQLiteDataReader:
         # The error should be about the table, not UnboundLocalError
         assert "UnboundLocalError" not in str(type(exc_info.value))
 
-    def test_sqlite_with_missing_date_column_should_raise_error(self, tmp_path):
+    def test_sqlite_with_missing_date_column_should_raise_error(self, sqlite_db):
         """
         Bug #6: Test that SQLiteDataReader raises error when date_column doesn't exist.
         Currently this test will FAIL because the bug exists.
         """
-        # Create test database with 'timestamp' column, not 'date'
-        db_file = tmp_path / "test.db"
-        conn = sqlite3.connect(str(db_file))
-        df = pd.DataFrame(
-            {
-                "timestamp": ["2024-01-01", "2024-01-02", "2024-01-03"],
-                "value": [1, 2, 3],
-            }
-        )
-        df.to_sql("test_table", conn, index=False)
-        conn.close()
-
-        # Try to load with date_column='date' (which doesn't exist)
+        # Try to load with date_column='date' from a table that only has
+        # a 'timestamp' column
         source = SQLiteDataReader(
-            database_path=str(db_file),
-            query="SELECT * FROM test_table",
+            database_path=sqlite_db,
+            query="SELECT * FROM timestamp_table",
             date_column="date",
         )
 
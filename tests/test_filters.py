@@ -10,6 +10,17 @@ from chronomaly.infrastructure.transformers.filters import (
 )
 
 
+@pytest.fixture(scope="module")
+def sessions_df():
+    """Metrics with session counts, shared read-only by the numeric filter tests."""
+    return pd.DataFrame(
+        {
+            "sessions": [50, 100, 500, 1000, 5000],
+            "metric": ["a", "b", "c", "d", "e"],
+        }
+    )
+
+
 class TestValueFilter:
     """Tests for ValueFilter"""
 
@@ -45,8 +56,30 @@ class TestValueFilter:
         assert len(result) == 3
         assert "tablet" not in result["platform"].values
 
-    def test_value_filter_numeric_min(self):
-        """Test filtering with minimum value."""
+    @pytest.mark.parametrize(
+        "min_value,max_value,expected_metrics",
+        [
+            (500, None, ["c", "d", "e"]),
+            (None, 1000, ["a", "b", "c", "d"]),
+            (100, 1000, ["b", "c", "d"]),
+        ],
+        ids=["min", "max", "range"],
+    )
+    def test_value_filter_numeric_bounds(
+        self, sessions_df, min_value, max_value, expected_metrics
+    ):
+        """Test filtering with minimum, maximum, or both values."""
+        filter = ValueFilter("sessions", min_value=min_value, max_value=max_value)
+        result = filter.filter(sessions_df)
+
+        assert result["metric"].tolist() == expected_metrics
+        if min_value is not None:
+            assert all(result["sessions"] >= min_value)
+        if max_value is not None:
+            assert all(result["sessions"] <= max_value)
+
+    def test_value_filter_numeric_min_float(self):
+        """Test filtering a float column with a float minimum value."""
         df = pd.DataFrame(
             {"deviation_pct": [5.0, 10.0, 15.0, 20.0], "metric": ["a", "b", "c", "d"]}
         )
@@ -57,33 +90,6 @@ class TestValueFilter:
         assert len(result) == 3
         assert all(result["deviation_pct"] >= 10.0)
 
-    def test_value_filter_numeric_max(self):
-        """Test filtering with maximum value."""
-        df = pd.DataFrame(
-            {"sessions": [100, 500, 1000, 5000], "metric": ["a", "b", "c", "d"]}
-        )
-
-        filter = ValueFilter("sessions", max_value=1000)
-        result = filter.filter(df)
-
-        assert len(result) == 3
-        assert all(result["sessions"] <= 1000)
-
-    def test_value_filter_numeric_range(self):
-        """Test filtering with both min and max values."""
-        df = pd.DataFrame(
-            {
-                "sessions": [50, 100, 500, 1000, 5000],
-                "metric": ["a", "b", "c", "d", "e"],
-            }
-        )
-
-        filter = ValueFilter("sessions", min_value=100, max_value=1000)
-        result = filter.filter(df)
-
-        assert len(result) == 3
-        assert all((result["sessions"] >= 100) & (result["sessions"] <= 1000))
-
     def test_value_filter_combined_categorical_and_numeric(self):
         """Test filtering with both categorical values and numeric threshold."""
         df = pd.DataFrame({"deviation_pct": [5.0, 15.0, 20.0, 25.0, 30.0]})
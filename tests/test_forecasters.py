@@ -6,6 +6,13 @@ Tests for bug #2.
 import pytest
 import pandas as pd
 import numpy as np
+from unittest.mock import MagicMock, patch
+
+# Skip the whole module when timesfm (or torch) is not installed
+timesfm_module = pytest.importorskip(
+    "chronomaly.infrastructure.forecasters.timesfm", reason="timesfm not installed"
+)
+TimesFMForecaster = timesfm_module.TimesFMForecaster
 
 
 class TestTimesFMForecaster:
@@ -16,20 +23,15 @@ class TestTimesFMForecaster:
         Bug #2: Test that _get_last_date doesn't have redundant datetime conversion.
         This is more of a code quality issue - we can verify by checking the code.
         """
-        # Import here to avoid timesfm dependency if not installed
-        try:
-            from chronomaly.infrastructure.forecasters import TimesFMForecaster
-        except ImportError:
-            pytest.skip("timesfm not installed")
-
         forecaster = TimesFMForecaster()
 
         # Create MultiIndex dataframe with datetime in first level
         dates = pd.date_range("2024-01-01", periods=3)
         stores = ["store1", "store2"]
         index = pd.MultiIndex.from_product([dates, stores], names=["date", "store"])
+        rng = np.random.default_rng(0)
         df = pd.DataFrame(
-            {"product_a": np.random.randn(6), "product_b": np.random.randn(6)},
+            {"product_a": rng.standard_normal(6), "product_b": rng.standard_normal(6)},
             index=index,
         )
 
@@ -40,11 +42,6 @@ class TestTimesFMForecaster:
 
     def test_get_last_date_with_datetime_index(self):
         """Test _get_last_date with regular DatetimeIndex"""
-        try:
-            from chronomaly.infrastructure.forecasters import TimesFMForecaster
-        except ImportError:
-            pytest.skip("timesfm not installed")
-
         forecaster = TimesFMForecaster()
 
         df = pd.DataFrame(
@@ -59,11 +56,6 @@ class TestTimesFMForecaster:
 
     def test_get_last_date_with_invalid_index_raises_error(self):
         """Test that _get_last_date raises proper error for non-datetime index"""
-        try:
-            from chronomaly.infrastructure.forecasters import TimesFMForecaster
-        except ImportError:
-            pytest.skip("timesfm not installed")
-
         forecaster = TimesFMForecaster()
 
         df = pd.DataFrame(
@@ -72,3 +64,128 @@ class TestTimesFMForecaster:
 
         with pytest.raises(ValueError, match="Could not parse index value"):
             forecaster._get_last_date(df)
+
+    def test_model_is_shared_between_forecasters_with_same_config(self):
+        """Test that forecasters with identical config reuse one loaded model"""
+        timesfm_module._load_compiled_model.cache_clear()
+        try:
+            with patch.object(
+                timesfm_module.timesfm.TimesFM_2p5_200M_torch,
+                "from_pretrained",
+                side_effect=lambda *args, **kwargs: MagicMock(),
+            ) as mock_from_pretrained:
+                first = TimesFMForecaster()._get_model()
+                second = TimesFMForecaster()._get_model()
+                other = TimesFMForecaster(max_horizon=128)._get_model()
+
+            assert first is second
+            assert other is not first
+            assert mock_from_pretrained.call_count == 2
+        finally:
+            timesfm_module._load_compiled_model.cache_clear()
+
+    def test_clear_model_cache_forces_reload(self):
+        """Test that clear_model_cache releases the shared compiled model"""
+        TimesFMForecaster.clear_model_cache()
+        try:
+            with patch.object(
+                timesfm_module.timesfm.TimesFM_2p5_200M_torch,
+                "from_pretrained",
+                side_effect=lambda *args, **kwargs: MagicMock(),
+            ) as mock_from_pretrained:
+                first = TimesFMForecaster()._get_model()
+                TimesFMForecaster.clear_model_cache()
+                second = TimesFMForecaster()._get_model()
+
+            assert first is not second
+            assert mock_from_pretrained.call_count == 2
+            assert timesfm_module._load_compiled_model.cache_info().currsize == 1
+        finally:
+            TimesFMForecaster.clear_model_cache()
+
+    def test_forecast_batches_all_columns_in_single_call(self):
+        """Test that all columns are sent to the model in one batched call"""
+        forecaster = TimesFMForecaster()
+
+        df = pd.DataFrame(
+            {"product_a": [1, 2, 3], "product_b": [4.0, 5.0, 6.0]},
+            index=pd.date_range("2024-01-01", periods=3),
+        )
+
+        mock_model = MagicMock()
+        mock_model.forecast.return_value = (
+            np.zeros((2, 2)),
+            np.zeros((2, 2, 10)),
+        )
+
+        with patch.object(forecaster, "_get_model", return_value=mock_model):
+            result = forecaster.forecast(df, horizon=2)
+
+        mock_model.forecast.assert_called_once()
+        inputs = mock_model.forecast.call_args.kwargs["inputs"]
+        assert len(inputs) == 2
+        np.testing.assert_array_equal(inputs[0], [1.0, 2.0, 3.0])
+        np.testing.assert_array_equal(inputs[1], [4.0, 5.0, 6.0])
+        assert list(result.columns) == ["date", "product_a", "product_b"]
+        assert len(result) == 2
+
+    def test_forecast_passes_nullable_missing_values_as_nan(self):
+        """Test that pd.NA in nullable columns reaches the model as NaN"""
+        forecaster = TimesFMForecaster()
+
+        df = pd.DataFrame(
+            {
+                "product_a": pd.array([1, None, 3], dtype="Int64"),
+                "product_b": pd.array([4.0, 5.0, None], dtype="Float64"),
+            },
+            index=pd.date_range("2024-01-01", periods=3),
+        )
+
+        mock_model = MagicMock()
+        mock_model.forecast.return_value = (
+            np.zeros((2, 2)),
+            np.zeros((2, 2, 10)),
+        )
+
+        with patch.object(forecaster, "_get_model", return_value=mock_model):
+            forecaster.forecast(df, horizon=2)
+
+        inputs = mock_model.forecast.call_args.kwargs["inputs"]
+        np.testing.assert_array_equal(inputs[0], [1.0, np.nan, 3.0])
+        np.testing.assert_array_equal(inputs[1], [4.0, 5.0, np.nan])
+
+    def test_forecast_non_numeric_input_raises_runtime_error(self):
+        """Test that non-numeric columns fail with the forecast RuntimeError"""
+        forecaster = TimesFMForecaster()
+
+        df = pd.DataFrame(
+            {"product_a": ["a", "b", "c"]},
+            index=pd.date_range("2024-01-01", periods=3),
+        )
+
+        mock_model = MagicMock()
+        with patch.object(forecaster, "_get_model", return_value=mock_model):
+            with pytest.raises(RuntimeError, match="TimesFM forecast failed"):
+                forecaster.forecast(df, horizon=2)
+
+        mock_model.forecast.assert_not_called()
+
+    def test_format_quantile_forecast_builds_pipe_strings(self):
+        """Test that quantiles are joined per series and horizon step"""
+        forecaster = TimesFMForecaster()
+
+        df = pd.DataFrame(
+            {"product_a": [1, 2, 3], "product_b": [4, 5, 6]},
+            index=pd.date_range("2024-01-01", periods=3),
+        )
+        # Shape: (series, horizon, quantiles)
+        quantiles = np.arange(2 * 2 * 3, dtype=np.float32).reshape(2, 2, 3)
+
+        result = forecaster._format_quantile_forecast(quantiles, df, horizon=2)
+
+        assert list(result.columns) == ["date", "product_a", "product_b"]
+        assert result.loc[0, "product_a"] == "0.0|1.0|2.0"
+        assert result.loc[1, "product_a"] == "3.0|4.0|5.0"
+        assert result.loc[0, "product_b"] == "6.0|7.0|8.0"
+        assert result.loc[1, "product_b"] == "9.0|10.0|11.0"
+        assert result.loc[0, "date"] == pd.Timestamp("2024-01-04").date()
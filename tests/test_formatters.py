@@ -74,6 +74,21 @@ class TestColumnFormatter:
         result = formatter.format(df)
         assert result.loc[0, "value"] == "15.346%"
 
+    def test_percentage_helper_matches_single_value_formatting(self):
+        """Test column formatting matches formatting each value on its own."""
+        df = pd.DataFrame(
+            {"value": [0.05, -0.04, 2.675, float("nan")], "count": [1, 20, 300, 4]}
+        )
+
+        formatter = ColumnFormatter.percentage(["value", "count"], decimal_places=1)
+        result = formatter.format(df)
+
+        for column in ["value", "count"]:
+            expected = [formatter.formatters[column](value) for value in df[column]]
+            assert result[column].tolist() == expected
+        assert result.loc[1, "value"] == "-0.0%"
+        assert result.loc[3, "value"] == "nan%"
+
     def test_date_formatting(self):
         """Test custom date formatting."""
         df = pd.DataFrame(
@@ -4,9 +4,25 @@ Tests for bugs #3, #4.
 """
 
 import pytest
+import numpy as np
 import pandas as pd
 from chronomaly.infrastructure.transformers import PivotTransformer
 
+# Daily nanosecond-resolution date columns (the resolution readers produce),
+# built from numpy day ranges once per module
+_DATES_3D = pd.DatetimeIndex(
+    np.arange("2024-01-01", "2024-01-04", dtype="datetime64[D]"),
+    dtype="datetime64[ns]",
+)
+_DATES_5D = pd.DatetimeIndex(
+    np.arange("2024-01-01", "2024-01-06", dtype="datetime64[D]"),
+    dtype="datetime64[ns]",
+)
+
+# Timestamps used in fixtures and lookups, parsed once per module
+_TS_JAN1 = pd.Timestamp("2024-01-01")
+_TS_JAN2 = pd.Timestamp("2024-01-02")
+
 
 class TestPivotTransformer:
     """Tests for PivotTransformer"""
@@ -15,7 +31,7 @@ class TestPivotTransformer:
         """Test basic pivot functionality"""
         df = pd.DataFrame(
             {
-                "date": pd.date_range("2024-01-01", periods=3),
+                "date": _DATES_3D,
                 "product": ["A", "B", "A"],
                 "sales": [100, 200, 150],
             }
@@ -37,13 +53,13 @@ class TestPivotTransformer:
         # Create dataframe with object column containing datetime objects
         df = pd.DataFrame(
             {
-                "date": pd.date_range("2024-01-01", periods=3),
+                "date": _DATES_3D,
                 "product": ["A", "B", "A"],
                 "sales": [100, 200, 150],
                 "metadata": [
-                    pd.Timestamp("2024-01-01"),
+                    _TS_JAN1,
                     None,
-                    pd.Timestamp("2024-01-02"),
+                    _TS_JAN2,
                 ],
             }
         )
@@ -66,7 +82,7 @@ class TestPivotTransformer:
         """
         df = pd.DataFrame(
             {
-                "timestamp": pd.date_range("2024-01-01", periods=5),
+                "timestamp": _DATES_5D,
                 "product": ["A", "B", "A", "B", "A"],
                 "sales": [100, 200, 150, 300, 250],
             }
@@ -87,7 +103,7 @@ class TestPivotTransformer:
         """Test that string columns are properly cleaned"""
         df = pd.DataFrame(
             {
-                "date": pd.date_range("2024-01-01", periods=3),
+                "date": _DATES_3D,
                 "product": ["Product A", "Product B", "Product A"],
                 "sales": [100, 200, 150],
             }
@@ -99,3 +115,26 @@ class TestPivotTransformer:
         # Verify that column names are cleaned (lowercase, no spaces)
         assert "producta" in result.columns
         assert "productb" in result.columns
+
+    def test_pivot_sums_duplicates_and_skips_unobserved_categories(self):
+        """Test aggregation with a categorical index level"""
+        df = pd.DataFrame(
+            {
+                "date": pd.to_datetime(["2024-01-01", "2024-01-01", "2024-01-02"]),
+                "region": pd.Categorical(
+                    ["eu", "eu", "us"], categories=["eu", "us", "apac"]
+                ),
+                "product": ["A", "A", "B"],
+                "sales": [100, 50, 200],
+            }
+        )
+
+        transformer = PivotTransformer(
+            index=["date", "region"], columns="product", values="sales"
+        )
+        result = transformer.pivot_table(df)
+
+        assert len(result) == 2
+        assert result.loc[(_TS_JAN1, "eu"), "a"] == 150
+        assert result.loc[(_TS_JAN2, "us"), "b"] == 200
+        assert result.loc[(_TS_JAN2, "us"), "a"] == 0
@@ -3,26 +3,56 @@ Tests for TimeSeriesVisualizer.
 """
 
 import pytest
+import matplotlib
+import matplotlib.pyplot as plt
 import pandas as pd
 import base64
 from chronomaly.infrastructure.visualizers import TimeSeriesVisualizer
 from chronomaly.infrastructure.data.readers import DataFrameDataReader
+from matplotlib.figure import Figure
 
+# Render off-screen so parallel test workers never touch a GUI backend; pyplot
+# is imported once per worker process here rather than inside a test
+matplotlib.use("Agg")
 
-class TestTimeSeriesVisualizerInit:
-    """Tests for TimeSeriesVisualizer initialization."""
 
-    def test_init_with_valid_readers(self):
-        """Test initialization with valid DataReader instances."""
-        anomaly_df = pd.DataFrame({"group_key": ["metric_a"], "value": [100]})
-        history_df = pd.DataFrame(
+@pytest.fixture(scope="module")
+def anomaly_reader():
+    """Reader for a single metric_a anomaly, built once per module."""
+    return DataFrameDataReader(
+        pd.DataFrame({"group_key": ["metric_a"], "value": [100]})
+    )
+
+
+@pytest.fixture(scope="module")
+def history_reader():
+    """Reader for three days of metric_a history, built once per module."""
+    return DataFrameDataReader(
+        pd.DataFrame(
             {"metric_a": [10, 20, 30]},
             index=pd.date_range("2024-01-01", periods=3),
         )
+    )
 
-        anomaly_reader = DataFrameDataReader(anomaly_df)
-        history_reader = DataFrameDataReader(history_df)
 
+@pytest.fixture(scope="module")
+def basic_charts(anomaly_reader, history_reader):
+    """Build one visualizer and render its charts and figures once per module."""
+    visualizer = TimeSeriesVisualizer(
+        anomaly_data=anomaly_reader,
+        history_data=history_reader,
+    )
+
+    yield visualizer, visualizer.generate_charts(), visualizer.get_figures()
+
+    plt.close("all")
+
+
+class TestTimeSeriesVisualizerInit:
+    """Tests for TimeSeriesVisualizer initialization."""
+
+    def test_init_with_valid_readers(self, anomaly_reader, history_reader):
+        """Test initialization with valid DataReader instances."""
         visualizer = TimeSeriesVisualizer(
             anomaly_data=anomaly_reader,
             history_data=history_reader,
@@ -57,49 +87,20 @@ class TestTimeSeriesVisualizerInit:
 class TestGenerateCharts:
     """Tests for generate_charts method."""
 
-    def test_generate_charts_returns_dict(self):
+    def test_generate_charts_returns_dict(self, basic_charts):
         """Test that generate_charts returns a dictionary."""
-        anomaly_df = pd.DataFrame({"group_key": ["metric_a"], "value": [100]})
-        history_df = pd.DataFrame(
-            {"metric_a": [10, 20, 30]},
-            index=pd.date_range("2024-01-01", periods=3),
-        )
-
-        anomaly_reader = DataFrameDataReader(anomaly_df)
-        history_reader = DataFrameDataReader(history_df)
-
-        visualizer = TimeSeriesVisualizer(
-            anomaly_data=anomaly_reader,
-            history_data=history_reader,
-        )
-
-        charts = visualizer.generate_charts()
+        _, charts, _ = basic_charts
 
         assert isinstance(charts, dict)
         assert "metric_a" in charts
 
-    def test_generate_charts_returns_base64(self):
+    def test_generate_charts_returns_base64(self, basic_charts):
         """Test that charts are valid base64-encoded images."""
-        anomaly_df = pd.DataFrame({"group_key": ["metric_a"], "value": [100]})
-        history_df = pd.DataFrame(
-            {"metric_a": [10, 20, 30]},
-            index=pd.date_range("2024-01-01", periods=3),
-        )
-
-        anomaly_reader = DataFrameDataReader(anomaly_df)
-        history_reader = DataFrameDataReader(history_df)
-
-        visualizer = TimeSeriesVisualizer(
-            anomaly_data=anomaly_reader,
-            history_data=history_reader,
-        )
-
-        charts = visualizer.generate_charts()
+        _, charts, _ = basic_charts
 
-        # Verify base64 can be decoded
-        decoded = base64.b64decode(charts["metric_a"])
-        # PNG files start with specific bytes
-        assert decoded[:8] == b"\x89PNG\r\n\x1a\n"
+        # PNG files start with specific bytes; the first 12 base64 characters
+        # decode to 9 bytes, which covers the 8-byte signature
+        assert base64.b64decode(charts["metric_a"][:12])[:8] == b"\x89PNG\r\n\x1a\n"
 
     def test_generate_charts_missing_group_key_warns(self):
         """Test warning when anomaly_data lacks group_key column."""
@@ -169,17 +170,8 @@ class TestGenerateCharts:
 class TestSaveCharts:
     """Tests for save_charts method."""
 
-    def test_save_charts_creates_files(self, tmp_path):
+    def test_save_charts_creates_files(self, anomaly_reader, history_reader, tmp_path):
         """Test that save_charts creates image files."""
-        anomaly_df = pd.DataFrame({"group_key": ["metric_a"], "value": [100]})
-        history_df = pd.DataFrame(
-            {"metric_a": [10, 20, 30]},
-            index=pd.date_range("2024-01-01", periods=3),
-        )
-
-        anomaly_reader = DataFrameDataReader(anomaly_df)
-        history_reader = DataFrameDataReader(history_df)
-
         visualizer = TimeSeriesVisualizer(
             anomaly_data=anomaly_reader,
             history_data=history_reader,
@@ -190,19 +182,12 @@ class TestSaveCharts:
         assert len(saved_files) == 1
         assert (tmp_path / "metric_a.png").exists()
 
-    def test_save_charts_creates_output_directory(self, tmp_path):
+    def test_save_charts_creates_output_directory(
+        self, anomaly_reader, history_reader, tmp_path
+    ):
         """Test that save_charts creates output directory if not exists."""
         output_dir = tmp_path / "subdir" / "charts"
 
-        anomaly_df = pd.DataFrame({"group_key": ["metric_a"], "value": [100]})
-        history_df = pd.DataFrame(
-            {"metric_a": [10, 20, 30]},
-            index=pd.date_range("2024-01-01", periods=3),
-        )
-
-        anomaly_reader = DataFrameDataReader(anomaly_df)
-        history_reader = DataFrameDataReader(history_df)
-
         visualizer = TimeSeriesVisualizer(
             anomaly_data=anomaly_reader,
             history_data=history_reader,
@@ -217,34 +202,12 @@ class TestSaveCharts:
 class TestGetFigures:
     """Tests for get_figures method."""
 
-    def test_get_figures_returns_figure_objects(self):
+    def test_get_figures_returns_figure_objects(self, basic_charts):
         """Test that get_figures returns matplotlib Figure objects."""
-        import matplotlib.pyplot as plt
-
-        anomaly_df = pd.DataFrame({"group_key": ["metric_a"], "value": [100]})
-        history_df = pd.DataFrame(
-            {"metric_a": [10, 20, 30]},
-            index=pd.date_range("2024-01-01", periods=3),
-        )
-
-        anomaly_reader = DataFrameDataReader(anomaly_df)
-        history_reader = DataFrameDataReader(history_df)
-
-        visualizer = TimeSeriesVisualizer(
-            anomaly_data=anomaly_reader,
-            history_data=history_reader,
-        )
-
-        figures = visualizer.get_figures()
+        _, _, figures = basic_charts
 
         assert isinstance(figures, dict)
         assert "metric_a" in figures
 
         # Verify it's a matplotlib Figure
-        from matplotlib.figure import Figure
-
         assert isinstance(figures["metric_a"], Figure)
-
-        # Cleanup
-        for fig in figures.values():
-            plt.close(fig)
@@ -4,159 +4,127 @@ Tests for workflow orchestrators.
 
 import pytest
 import pandas as pd
-from unittest.mock import Mock
 from chronomaly.application.workflows import AnomalyDetectionWorkflow
 from chronomaly.infrastructure.data.readers.base import DataReader
 from chronomaly.infrastructure.anomaly_detectors.base import AnomalyDetector
 from chronomaly.infrastructure.data.writers.base import DataWriter
 
+# Shared read-only frames; the workflow and stubs never modify them, so tests
+# reuse the same objects. Tests must not mutate them either: all per-test state
+# lives on the stubs, which keeps tests order-independent under pytest-xdist.
+_DATE = pd.to_datetime(["2024-01-01"])
+_FORECAST_DF = pd.DataFrame(
+    {
+        "date": _DATE,
+        "metric_a": ["100|90|92|95|98|100|102|105|108|110"],
+    }
+)
+_ACTUAL_DF = pd.DataFrame({"date": _DATE, "metric": ["metric_a"], "value": [95]})
+_DETECTION_DF = pd.DataFrame(
+    {"date": _DATE, "metric": ["metric_a"], "status": ["IN_RANGE"]}
+)
+_EMPTY_DF = pd.DataFrame()
 
-class TestAnomalyDetectionWorkflow:
-    """Tests for AnomalyDetectionWorkflow"""
 
-    def test_basic_workflow_execution(self):
-        """Test basic workflow execution without transformers."""
-        # Create mock components
-        mock_forecast_reader = Mock(spec=DataReader)
-        mock_forecast_reader.load.return_value = pd.DataFrame(
-            {
-                "date": ["2024-01-01"],
-                "metric_a": ["100|90|92|95|98|100|102|105|108|110"],
-            }
-        )
+class _StubReader(DataReader):
+    """DataReader that returns a canned frame and counts load() calls."""
 
-        mock_actual_reader = Mock(spec=DataReader)
-        mock_actual_reader.load.return_value = pd.DataFrame(
-            {"date": ["2024-01-01"], "metric": ["metric_a"], "value": [95]}
-        )
+    def __init__(self, dataframe):
+        self.dataframe = dataframe
+        self.calls = 0
 
-        mock_detector = Mock(spec=AnomalyDetector)
-        mock_detector.detect.return_value = pd.DataFrame(
-            {"date": ["2024-01-01"], "metric": ["metric_a"], "status": ["IN_RANGE"]}
-        )
+    def load(self):
+        self.calls += 1
+        return self.dataframe
 
-        mock_writer = Mock(spec=DataWriter)
 
-        # Create workflow
-        workflow = AnomalyDetectionWorkflow(
-            forecast_reader=mock_forecast_reader,
-            actual_reader=mock_actual_reader,
-            anomaly_detector=mock_detector,
-            data_writer=mock_writer,
-        )
+class _StubDetector(AnomalyDetector):
+    """AnomalyDetector that returns a canned frame and counts detect() calls."""
 
-        # Execute
-        result = workflow.run()
+    def __init__(self, result):
+        self.result = result
+        self.calls = 0
 
-        # Verify
-        assert result is not None
-        assert len(result) == 1
-        mock_forecast_reader.load.assert_called_once()
-        mock_actual_reader.load.assert_called_once()
-        mock_detector.detect.assert_called_once()
-        mock_writer.write.assert_called_once()
+    def detect(self, forecast_df, actual_df):
+        self.calls += 1
+        return self.result
 
-    def test_workflow_with_transformers(self):
-        """Test workflow execution with transformers at component level."""
-        # Create mock components
-        mock_forecast_reader = Mock(spec=DataReader)
-        mock_forecast_reader.load.return_value = pd.DataFrame(
-            {
-                "date": ["2024-01-01"],
-                "metric_a": ["100|90|92|95|98|100|102|105|108|110"],
-            }
-        )
 
-        mock_actual_reader = Mock(spec=DataReader)
-        mock_actual_reader.load.return_value = pd.DataFrame(
-            {"date": ["2024-01-01"], "metric": ["metric_a"], "value": [95]}
-        )
+class _StubWriter(DataWriter):
+    """DataWriter that only counts write() calls."""
 
-        # Create mock detector with transformers
-        mock_detector = Mock(spec=AnomalyDetector)
-        mock_detector.detect.return_value = pd.DataFrame(
-            {"date": ["2024-01-01"], "metric": ["metric_a"], "status": ["IN_RANGE"]}
-        )
+    def __init__(self):
+        self.calls = 0
 
-        mock_writer = Mock(spec=DataWriter)
+    def write(self, dataframe):
+        self.calls += 1
 
-        # Transformers are now configured at component level (not workflow level)
-        workflow = AnomalyDetectionWorkflow(
-            forecast_reader=mock_forecast_reader,
-            actual_reader=mock_actual_reader,
-            anomaly_detector=mock_detector,
-            data_writer=mock_writer,
-        )
+
+class TestAnomalyDetectionWorkflow:
+    """Tests for AnomalyDetectionWorkflow"""
+
+    def setup_method(self, method):
+        """Create fresh stubs returning the shared frames for each test."""
+        self.forecast_reader = _StubReader(_FORECAST_DF)
+        self.actual_reader = _StubReader(_ACTUAL_DF)
+        self.detector = _StubDetector(_DETECTION_DF)
+        self.writer = _StubWriter()
+
+    def _make_workflow(self, **overrides):
+        """Build a workflow from this test's stubs, replacing any given component."""
+        components = {
+            "forecast_reader": self.forecast_reader,
+            "actual_reader": self.actual_reader,
+            "anomaly_detector": self.detector,
+            "data_writer": self.writer,
+        }
+        components.update(overrides)
+        return AnomalyDetectionWorkflow(**components)
+
+    @pytest.mark.parametrize(
+        "with_writer", [True, False], ids=["with_writer", "without_writer"]
+    )
+    def test_basic_workflow_execution(self, with_writer):
+        """Test basic workflow execution with and without a data_writer."""
+        # Create workflow
+        if with_writer:
+            workflow = self._make_workflow()
+        else:
+            workflow = self._make_workflow(data_writer=None)
 
         # Execute
         result = workflow.run()
 
-        # Verify workflow executed successfully
+        # Verify
         assert result is not None
-
-    def test_workflow_empty_forecast_raises_error(self):
-        """Test that empty forecast data raises ValueError."""
-        mock_forecast_reader = Mock(spec=DataReader)
-        mock_forecast_reader.load.return_value = pd.DataFrame()  # Empty
-
-        mock_actual_reader = Mock(spec=DataReader)
-        mock_detector = Mock(spec=AnomalyDetector)
-        mock_writer = Mock(spec=DataWriter)
-
-        workflow = AnomalyDetectionWorkflow(
-            forecast_reader=mock_forecast_reader,
-            actual_reader=mock_actual_reader,
-            anomaly_detector=mock_detector,
-            data_writer=mock_writer,
-        )
-
-        with pytest.raises(ValueError, match="Forecast reader returned empty dataset"):
-            workflow.run()
-
-    def test_workflow_empty_actual_raises_error(self):
-        """Test that empty actual data raises ValueError."""
-        mock_forecast_reader = Mock(spec=DataReader)
-        mock_forecast_reader.load.return_value = pd.DataFrame(
-            {
-                "date": ["2024-01-01"],
-                "metric_a": ["100|90|92|95|98|100|102|105|108|110"],
-            }
-        )
-
-        mock_actual_reader = Mock(spec=DataReader)
-        mock_actual_reader.load.return_value = pd.DataFrame()  # Empty
-
-        mock_detector = Mock(spec=AnomalyDetector)
-        mock_writer = Mock(spec=DataWriter)
-
-        workflow = AnomalyDetectionWorkflow(
-            forecast_reader=mock_forecast_reader,
-            actual_reader=mock_actual_reader,
-            anomaly_detector=mock_detector,
-            data_writer=mock_writer,
-        )
-
-        with pytest.raises(ValueError, match="Actual reader returned empty dataset"):
+        assert len(result) == 1
+        assert self.forecast_reader.calls == 1
+        assert self.actual_reader.calls == 1
+        assert self.detector.calls == 1
+        assert self.writer.calls == (1 if with_writer else 0)
+
+    @pytest.mark.parametrize(
+        "empty_reader,message",
+        [
+            ("forecast_reader", "Forecast reader returned empty dataset"),
+            ("actual_reader", "Actual reader returned empty dataset"),
+        ],
+        ids=["forecast", "actual"],
+    )
+    def test_workflow_empty_input_raises_error(self, empty_reader, message):
+        """Test that empty forecast or actual data raises ValueError."""
+        getattr(self, empty_reader).dataframe = _EMPTY_DF
+
+        workflow = self._make_workflow()
+
+        with pytest.raises(ValueError) as exc_info:
             workflow.run()
+        assert message in str(exc_info.value)
 
     def test_workflow_empty_detection_result_returns_empty_dataframe(self):
         """Test that empty detection result returns empty DataFrame with schema."""
-        mock_forecast_reader = Mock(spec=DataReader)
-        mock_forecast_reader.load.return_value = pd.DataFrame(
-            {
-                "date": ["2024-01-01"],
-                "metric_a": ["100|90|92|95|98|100|102|105|108|110"],
-            }
-        )
-
-        mock_actual_reader = Mock(spec=DataReader)
-        mock_actual_reader.load.return_value = pd.DataFrame(
-            {"date": ["2024-01-01"], "metric": ["metric_a"], "value": [95]}
-        )
-
-        # Mock detector that returns empty DataFrame with schema
-        mock_detector = Mock(spec=AnomalyDetector)
-        empty_result = pd.DataFrame(
+        # Detector that returns empty DataFrame with schema
+        self.detector.result = pd.DataFrame(
             {
                 "date": pd.Series(dtype="object"),
                 "group_key": pd.Series(dtype="object"),
@@ -169,16 +137,8 @@ class TestAnomalyDetectionWorkflow:
                 "anomaly_score": pd.Series(dtype="float64"),
             }
         )
-        mock_detector.detect.return_value = empty_result
 
-        mock_writer = Mock(spec=DataWriter)
-
-        workflow = AnomalyDetectionWorkflow(
-            forecast_reader=mock_forecast_reader,
-            actual_reader=mock_actual_reader,
-            anomaly_detector=mock_detector,
-            data_writer=mock_writer,
-        )
+        workflow = self._make_workflow()
 
         result = workflow.run()
 
@@ -188,113 +148,4 @@ class TestAnomalyDetectionWorkflow:
         assert "date" in result.columns
         assert "group_key" in result.columns
         assert "alert_type" in result.columns
-        mock_writer.write.assert_called_once()
-
-    def test_run_without_output(self):
-        """Test running workflow without data_writer."""
-        mock_forecast_reader = Mock(spec=DataReader)
-        mock_forecast_reader.load.return_value = pd.DataFrame(
-            {
-                "date": ["2024-01-01"],
-                "metric_a": ["100|90|92|95|98|100|102|105|108|110"],
-            }
-        )
-
-        mock_actual_reader = Mock(spec=DataReader)
-        mock_actual_reader.load.return_value = pd.DataFrame(
-            {"date": ["2024-01-01"], "metric": ["metric_a"], "value": [95]}
-        )
-
-        mock_detector = Mock(spec=AnomalyDetector)
-        mock_detector.detect.return_value = pd.DataFrame(
-            {"date": ["2024-01-01"], "metric": ["metric_a"], "status": ["IN_RANGE"]}
-        )
-
-        workflow = AnomalyDetectionWorkflow(
-            forecast_reader=mock_forecast_reader,
-            actual_reader=mock_actual_reader,
-            anomaly_detector=mock_detector,
-            data_writer=None,
-        )
-
-        # Execute without writing (data_writer is None)
-        result = workflow.run()
-
-        # Verify result is returned
-        assert result is not None
-
-    def test_transformer_with_format_method(self):
-        """Test that transformers with .format() method work correctly
-        at component level."""
-        mock_forecast_reader = Mock(spec=DataReader)
-        mock_forecast_reader.load.return_value = pd.DataFrame(
-            {
-                "date": ["2024-01-01"],
-                "metric_a": ["100|90|92|95|98|100|102|105|108|110"],
-            }
-        )
-
-        mock_actual_reader = Mock(spec=DataReader)
-        mock_actual_reader.load.return_value = pd.DataFrame(
-            {"date": ["2024-01-01"], "metric": ["metric_a"], "value": [95]}
-        )
-
-        # Mock detector handles transformers internally
-        mock_detector = Mock(spec=AnomalyDetector)
-        mock_detector.detect.return_value = pd.DataFrame(
-            {"date": ["2024-01-01"], "metric": ["metric_a"], "status": ["IN_RANGE"]}
-        )
-
-        mock_writer = Mock(spec=DataWriter)
-
-        # Transformers are configured at component level (detector, reader, writer)
-        workflow = AnomalyDetectionWorkflow(
-            forecast_reader=mock_forecast_reader,
-            actual_reader=mock_actual_reader,
-            anomaly_detector=mock_detector,
-            data_writer=mock_writer,
-        )
-
-        result = workflow.run()
-
-        # Verify workflow executed successfully
-        assert result is not None
-
-    def test_transformer_callable(self):
-        """Test that callable transformers work correctly at component level."""
-        mock_forecast_reader = Mock(spec=DataReader)
-        mock_forecast_reader.load.return_value = pd.DataFrame(
-            {
-                "date": ["2024-01-01"],
-                "metric_a": ["100|90|92|95|98|100|102|105|108|110"],
-            }
-        )
-
-        mock_actual_reader = Mock(spec=DataReader)
-        mock_actual_reader.load.return_value = pd.DataFrame(
-            {"date": ["2024-01-01"], "metric": ["metric_a"], "value": [95]}
-        )
-
-        mock_detector = Mock(spec=AnomalyDetector)
-        mock_detector.detect.return_value = pd.DataFrame(
-            {"date": ["2024-01-01"], "metric": ["metric_a"], "status": ["IN_RANGE"]}
-        )
-
-        mock_writer = Mock(spec=DataWriter)
-
-        # Transformers are configured at component level (detector, reader, writer)
-        workflow = AnomalyDetectionWorkflow(
-            forecast_reader=mock_forecast_reader,
-            actual_reader=mock_actual_reader,
-            anomaly_detector=mock_detector,
-            data_writer=mock_writer,
-        )
-
-        result = workflow.run()
-
-        # Verify workflow executed successfully
-        assert result is not None
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+        assert self.writer.calls == 1